@@ -11,11 +11,16 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/Stolarski-Lukasz/vocalysis",
-    packages=find_packages(),
+    packages=find_packages(exclude=["build", "build.*", "tests", "tests.*"]),
     install_requires=[
         "praat-parselmouth>=0.4.4",
         "numpy>=1.26.0",
     ],
+    extras_require={
+        "numba": ["numba>=0.59"],
+        "soundfile": ["soundfile>=0.12"],
+        "test": ["pytest"],
+    },
     license="GPL-3.0-or-later",
     classifiers=[
         "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
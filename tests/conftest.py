@@ -0,0 +1,34 @@
+import numpy as np
+import parselmouth
+import pytest
+
+SAMPLING_FREQUENCY = 16000
+
+
+def _synthetic_voice(duration=2.0, seed=0):
+    """
+    A vowel-like signal: a harmonic source with vibrato, jitter and shimmer, a pause in the
+    middle (so that there are unvoiced frames and a voice break) and some background noise.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * SAMPLING_FREQUENCY)) / SAMPLING_FREQUENCY
+    f0 = 120 + 10 * np.sin(2 * np.pi * 5 * t) + rng.normal(0, 1.5, t.size).cumsum() / 200
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLING_FREQUENCY
+    envelope = 1 + 0.1 * np.sin(2 * np.pi * 3 * t)
+    source = sum(np.sin(k * phase) / k for k in range(1, 30))
+    signal = envelope * source
+    signal[(t > 0.9) & (t < 1.1)] = 0.0
+    signal += rng.normal(0, 0.01, t.size)
+    return 0.3 * signal / np.abs(signal).max()
+
+
+@pytest.fixture(scope="session")
+def audio_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("audio") / "voice.wav"
+    parselmouth.Sound(_synthetic_voice(), sampling_frequency=SAMPLING_FREQUENCY).save(str(path), "WAV")
+    return str(path)
+
+
+@pytest.fixture
+def sound(audio_path):
+    return parselmouth.Sound(audio_path)
@@ -0,0 +1,69 @@
+import os
+import shutil
+
+import parselmouth
+import pytest
+
+from vocalysis import _cache, clear_cache, get_voice_report, measure_jitter, measure_pitch, measure_voicing
+
+
+@pytest.fixture
+def own_audio_path(audio_path, tmp_path):
+    # A private copy whose modification time can be changed
+    path = str(tmp_path / "voice.wav")
+    shutil.copy(audio_path, path)
+    clear_cache()
+    yield path
+    clear_cache()
+
+
+def test_repeated_audio_path_reuses_analyses(own_audio_path):
+    measure_pitch(audio_path=own_audio_path)
+    sound_hits = _cache._load_sound.cache_info().hits
+    pitch_hits = _cache._load_pitch.cache_info().hits
+    measure_jitter(audio_path=own_audio_path, max_pitch=500)
+    assert _cache._load_sound.cache_info().hits > sound_hits
+    assert _cache._load_pitch.cache_info().hits > pitch_hits
+    assert measure_pitch(audio_path=own_audio_path) == measure_pitch(sound_object=parselmouth.Sound(own_audio_path))
+
+
+def test_modified_file_is_reanalysed(own_audio_path):
+    first = _cache._load_sound(*_cache._file_key(own_audio_path))
+    assert _cache._load_sound(*_cache._file_key(own_audio_path)) is first
+    mtime = os.path.getmtime(own_audio_path)
+    os.utime(own_audio_path, (mtime + 10, mtime + 10))
+    assert _cache._load_sound(*_cache._file_key(own_audio_path)) is not first
+
+
+def test_clear_cache(own_audio_path):
+    measure_pitch(audio_path=own_audio_path)
+    assert _cache._load_sound.cache_info().currsize == 1
+    clear_cache()
+    for loader in (_cache._load_sound, _cache._load_duration, _cache._load_pitch, _cache._load_point_process,
+                   _cache._load_intensity):
+        assert loader.cache_info().currsize == 0
+
+
+def test_voice_report_bypasses_cache(own_audio_path):
+    get_voice_report(own_audio_path)
+    assert _cache._load_sound.cache_info().currsize == 0
+
+
+def test_missing_file_raises_praat_error(tmp_path):
+    missing = str(tmp_path / "missing.wav")
+    with pytest.raises(parselmouth.PraatError):
+        measure_pitch(audio_path=missing)
+    with pytest.raises(RuntimeError):
+        get_voice_report(missing)
+
+
+@pytest.mark.parametrize("without_soundfile", [False, True])
+def test_voicing_duration_from_audio_path(own_audio_path, monkeypatch, without_soundfile):
+    # The duration is read from the file header (soundfile) or from the decoded Sound
+    if without_soundfile:
+        monkeypatch.setattr(_cache, "soundfile", None)
+    sound = parselmouth.Sound(own_audio_path)
+    pitch = sound.to_pitch(pitch_floor=75, pitch_ceiling=500)
+    point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
+    assert measure_voicing(point_process=point_process, pitch_object=pitch, audio_path=own_audio_path) == \
+        measure_voicing(point_process=point_process, pitch_object=pitch, sound_object=sound)
@@ -0,0 +1,23 @@
+import pytest
+
+from vocalysis import (
+    format_report, get_voice_report, measure_formant_statistics, measure_intensity, measure_jitter, measure_pitch,
+    measure_pulses, measure_shimmer, measure_spectral_shape, measure_voicing
+)
+
+
+@pytest.mark.parametrize("measure", [
+    measure_pitch, measure_pulses, measure_voicing, measure_jitter, measure_shimmer, measure_intensity,
+    measure_spectral_shape, measure_formant_statistics,
+])
+def test_format_report_round_trip(sound, measure):
+    assert format_report(measure(sound_object=sound, as_string=False)) == measure(sound_object=sound)
+
+
+def test_format_report_nested(audio_path):
+    assert format_report(get_voice_report(audio_path, as_string=False)) == get_voice_report(audio_path)
+
+
+def test_format_report_precision():
+    formatted = format_report({'jitter_local': 0.0202285, 'jitter_local_absolute': 0.0001, 'jitter_ddp': None}, precision=1)
+    assert formatted == {'jitter_local': "2.0%", 'jitter_local_absolute': "0.0", 'jitter_ddp': None}
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from parselmouth.praat import call
+
+from vocalysis import _kernels
+
+# Each kernel is checked in its plain-Python loop form (what Numba compiles), as its NumPy
+# fallback, and as exported by the module (compiled when Numba is installed).
+IMPLEMENTATIONS = ["loop", "fallback", "exported"]
+
+
+def _kernel(name, implementation):
+    loop, fallback = _kernels._KERNELS[name]
+    return {"loop": loop, "fallback": fallback, "exported": getattr(_kernels, name)}[implementation]
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(1).normal(100, 20, 1001)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_mean_std(values, implementation):
+    mean, std = _kernel('mean_std', implementation)(values)
+    assert mean == pytest.approx(values.mean(), rel=1e-12)
+    assert std == pytest.approx(values.std(ddof=1), rel=1e-12)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_mean_std_short(implementation):
+    mean_std = _kernel('mean_std', implementation)
+    assert np.isnan(mean_std(np.empty(0))).all()
+    mean, std = mean_std(np.array([3.0]))
+    assert mean == 3.0 and np.isnan(std)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_nan_mean_std(values, implementation):
+    values[::7] = np.nan
+    mean, std = _kernel('nan_mean_std', implementation)(values)
+    assert mean == pytest.approx(np.nanmean(values), rel=1e-12)
+    assert std == pytest.approx(np.nanstd(values, ddof=1), rel=1e-12)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_spectral_moments(sound, implementation):
+    spectrum = sound.to_spectrum()
+    re, im = spectrum.values
+    moments = _kernel('spectral_moments', implementation)(re, im, spectrum.x1, spectrum.dx)
+    expected = [call(spectrum, query, 2) for query in
+                ("Get centre of gravity", "Get standard deviation", "Get skewness", "Get kurtosis")]
+    assert moments == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_spectral_moments_silence(implementation):
+    zeros = np.zeros(16)
+    assert np.isnan(_kernel('spectral_moments', implementation)(zeros, zeros, 0.0, 1.0)).all()
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_voice_breaks(implementation):
+    times = np.array([0.0, 0.01, 0.02, 0.05, 0.06, 0.2, 0.21])
+    count, total = _kernel('voice_breaks', implementation)(times, 0.02)
+    assert count == 2
+    assert total == pytest.approx(0.03 + 0.14)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 8, 1000, 1001])
+def test_median(size):
+    values = np.random.default_rng(size).normal(100, 20, size)
+    assert _kernels.median(values) == np.median(values)
+    with_nan = np.append(values, [np.nan, np.nan])
+    assert _kernels.median(with_nan) == np.nanmedian(with_nan)
+    copy = values.copy()
+    assert _kernels.median(copy, overwrite_input=True) == np.median(values)
+
+
+def test_median_all_nan():
+    assert np.isnan(_kernels.median(np.full(3, np.nan)))
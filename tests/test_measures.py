@@ -0,0 +1,136 @@
+import numpy as np
+from parselmouth.praat import call
+
+from vocalysis import (
+    get_voice_report, get_voice_reports, measure_formant_statistics, measure_intensity, measure_jitter, measure_pitch, measure_pulses,
+    measure_shimmer, measure_spectral_shape, measure_voicing
+)
+
+# Expected values are computed with the Praat queries the measures are defined by, and
+# formatted as in the original string output.
+
+
+def _point_process(sound, min_pitch=75, max_pitch=500):
+    pitch = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
+    return pitch, call([sound, pitch], "To PointProcess (cc)")
+
+
+def test_pitch(sound):
+    pitch = sound.to_pitch(pitch_floor=75, pitch_ceiling=500)
+    assert measure_pitch(sound_object=sound) == {
+        'median': f"{call(pitch, 'Get quantile', 0, 0, 0.5, 'Hertz'):.3f} Hz",
+        'mean': f"{call(pitch, 'Get mean', 0, 0, 'Hertz'):.3f} Hz",
+        'std': f"{call(pitch, 'Get standard deviation', 0, 0, 'Hertz'):.3f} Hz",
+        'min': f"{call(pitch, 'Get minimum', 0, 0, 'Hertz', 'Parabolic'):.3f} Hz",
+        'max': f"{call(pitch, 'Get maximum', 0, 0, 'Hertz', 'Parabolic'):.3f} Hz",
+    }
+
+
+def test_intensity(sound):
+    intensity = sound.to_intensity(time_step=0.01, minimum_pitch=75)
+    assert measure_intensity(sound_object=sound) == {
+        'intensity_median': f"{call(intensity, 'Get quantile', 0, 0, 0.5):.3f} dB",
+        'intensity_mean': f"{call(intensity, 'Get mean', 0, 0, 'dB'):.3f} dB",
+        'intensity_std': f"{call(intensity, 'Get standard deviation', 0, 0):.3f} dB",
+        'intensity_min': f"{call(intensity, 'Get minimum', 0, 0, 'Parabolic'):.3f} dB",
+        'intensity_max': f"{call(intensity, 'Get maximum', 0, 0, 'Parabolic'):.3f} dB",
+    }
+
+
+def test_voicing(sound):
+    pitch, point_process = _point_process(sound)
+    times = [call(point_process, "Get time from index", i + 1) for i in range(call(point_process, "Get number of points"))]
+    breaks = [b - a for a, b in zip(times, times[1:]) if b - a > 1.25 / 75]
+    unvoiced = (1 - pitch.count_voiced_frames() / pitch.get_number_of_frames()) * 100
+    assert len(breaks) > 0
+    assert measure_voicing(sound_object=sound) == {
+        'unvoiced_fraction': f"{unvoiced:.3f}%",
+        'num_voice_breaks': len(breaks),
+        'degree_voice_breaks': f"{sum(breaks) / sound.get_total_duration() * 100:.3f}%",
+    }
+
+
+def test_jitter(sound):
+    _, point_process = _point_process(sound)
+    query = lambda command: call(point_process, command, 0, 0, 0.0001, 0.02, 1.3)
+    expected = {
+        'jitter_local': query("Get jitter (local)"),
+        'jitter_local_absolute': query("Get jitter (local, absolute)"),
+        'jitter_rap': query("Get jitter (rap)"),
+        'jitter_ppq5': query("Get jitter (ppq5)"),
+        'jitter_ddp': query("Get jitter (ddp)"),
+    }
+    assert measure_jitter(point_process=point_process, as_string=False) == expected
+    assert measure_jitter(sound_object=sound, max_pitch=500) == {
+        key: f"{value:.6f}" if key == 'jitter_local_absolute' else f"{value * 100:.3f}%"
+        for key, value in expected.items()
+    }
+
+
+def test_spectral_shape(sound):
+    spectrum = sound.to_spectrum()
+    assert measure_spectral_shape(sound_object=sound) == {
+        'center_of_gravity': f"{call(spectrum, 'Get centre of gravity', 2):.2f} Hz",
+        'std': f"{call(spectrum, 'Get standard deviation', 2):.2f} Hz",
+        'skewness': f"{call(spectrum, 'Get skewness', 2):.3f}",
+        'kurtosis': f"{call(spectrum, 'Get kurtosis', 2):.3f}",
+    }
+
+
+def test_voice_reports(audio_path):
+    expected = [get_voice_report(audio_path)] * 2
+    assert get_voice_reports([audio_path, audio_path], parallel=False) == expected
+    assert get_voice_reports([audio_path, audio_path], parallel=True, max_workers=2) == expected
+
+
+def test_pulses(sound):
+    _, point_process = _point_process(sound)
+    num_pulses = call(point_process, "Get number of points")
+    assert measure_pulses(sound_object=sound) == {
+        'num_pulses': num_pulses,
+        'num_periods': num_pulses - 1,
+        'mean_period': f"{call(point_process, 'Get mean period', 0, 0, 0.0001, 0.02, 1.3):.10f} seconds",
+        'std_period': f"{call(point_process, 'Get stdev period', 0, 0, 0.0001, 0.02, 1.3):.10f} seconds",
+    }
+
+
+def test_shimmer(sound):
+    _, point_process = _point_process(sound)
+    expected = {
+        key: call([sound, point_process], command, 0, 0, 0.0001, 0.02, 1.3, 1.6)
+        for key, command in [
+            ('shimmer_local', "Get shimmer (local)"),
+            ('shimmer_local_dB', "Get shimmer (local_dB)"),
+            ('shimmer_apq3', "Get shimmer (apq3)"),
+            ('shimmer_apq5', "Get shimmer (apq5)"),
+            ('shimmer_apq11', "Get shimmer (apq11)"),
+            ('shimmer_dda', "Get shimmer (dda)"),
+        ]
+    }
+    assert measure_shimmer(point_process=point_process, sound_object=sound, as_string=False) == expected
+    assert measure_shimmer(sound_object=sound, max_pitch=500) == {
+        key: f"{value:.3f} dB" if key == 'shimmer_local_dB' else f"{value * 100:.3f}%"
+        for key, value in expected.items()
+    }
+
+
+def test_shimmer_follows_in_place_changes(sound):
+    _, point_process = _point_process(sound)
+    before = measure_shimmer(point_process=point_process, sound_object=sound, as_string=False)
+    sound.values[:] *= 1 + 0.5 * np.sin(np.arange(sound.values.shape[1]) / 37)
+    after = measure_shimmer(point_process=point_process, sound_object=sound, as_string=False)
+    assert after['shimmer_local'] == call([sound, point_process], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
+    assert after['shimmer_local'] != before['shimmer_local']
+
+
+def test_formant_statistics(sound):
+    formant = call(sound, "To Formant (burg)", 0, 5, 5500.0, 0.025, 50)
+    expected = {}
+    for i in range(1, 5):
+        expected[f"F{i}_mean"] = call(formant, "Get mean", i, 0, 0, "hertz")
+        expected[f"F{i}_std"] = call(formant, "Get standard deviation", i, 0, 0, "hertz")
+        expected[f"F{i}_min"] = call(formant, "Get minimum", i, 0, 0, "hertz", "Parabolic")
+        expected[f"F{i}_max"] = call(formant, "Get maximum", i, 0, 0, "hertz", "Parabolic")
+        expected[f"F{i}_median"] = call(formant, "Get quantile", i, 0, 0, "hertz", 0.5)
+        expected[f"F{i}_bandwidth_median"] = call(formant, "Get quantile of bandwidth", i, 0, 0, "hertz", 0.5)
+    assert measure_formant_statistics(sound_object=sound) == {key: f"{value:.2f} Hz" for key, value in expected.items()}
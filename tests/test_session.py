@@ -0,0 +1,23 @@
+import pytest
+
+from vocalysis import (
+    VocalysisSession, get_voice_report, measure_formant_statistics, measure_intensity, measure_spectral_shape
+)
+
+
+@pytest.mark.parametrize("as_string", [True, False])
+def test_session_matches_free_functions(audio_path, as_string):
+    session = VocalysisSession(audio_path)
+    assert session.voice_report(as_string=as_string) == get_voice_report(audio_path, as_string=as_string)
+    assert session.spectral_shape(as_string=as_string) == \
+        measure_spectral_shape(audio_path=audio_path, as_string=as_string)
+    assert session.formant_statistics(as_string=as_string) == \
+        measure_formant_statistics(audio_path=audio_path, as_string=as_string)
+
+
+def test_session_objects_are_private(audio_path):
+    expected = measure_intensity(audio_path=audio_path)
+    session = VocalysisSession(audio_path)
+    session.sound_object.scale_intensity(40)
+    assert measure_intensity(audio_path=audio_path) == expected
+    assert VocalysisSession(audio_path).intensity() == expected
@@ -1,5 +1,8 @@
 __version__ = "0.2.1"
 
-from .voice_report import measure_pitch, measure_pulses, measure_voicing, measure_jitter, measure_shimmer, measure_intensity, get_voice_report
+from .voice_report import measure_pitch, measure_pulses, measure_voicing, measure_jitter, measure_shimmer, measure_intensity, get_voice_report, get_voice_reports
 from .spectral_shape import measure_spectral_shape
 from .formants import measure_formant_statistics
+from .formatting import format_report
+from .session import VocalysisSession
+from ._cache import clear_cache
@@ -0,0 +1,91 @@
+import os
+from functools import lru_cache
+
+import parselmouth
+
+try:
+    import soundfile
+except ImportError:  # soundfile is optional; durations are then read from a decoded Sound
+    soundfile = None
+
+# Only the most recent analyses are kept: enough for several measures on the same file,
+# while a loop over many files does not keep every decoded recording alive
+_CACHE_SIZE = 2
+
+
+def _file_key(audio_path):
+    """
+    Return the `(path, mtime)` pair that keys all cached analyses of an audio file.
+
+    The modification time is part of the key so that an edited file is re-analysed
+    instead of being served from a stale cache entry.
+    """
+    try:
+        mtime = os.path.getmtime(audio_path)
+    except OSError:
+        # Let Praat report the unreadable file, with the same PraatError as an uncached load
+        parselmouth.Sound(audio_path)
+        raise
+    return os.path.abspath(audio_path), mtime
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_sound(audio_path, mtime):
+    return parselmouth.Sound(audio_path)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_duration(audio_path, mtime):
+    """
+    Return the duration of an audio file in seconds.
+
+    With soundfile installed, only the file header is read; otherwise (or for formats
+    soundfile cannot open) the file is decoded through the Sound cache.
+    """
+    if soundfile is not None:
+        try:
+            info = soundfile.info(audio_path)
+            return info.frames / info.samplerate
+        except RuntimeError:
+            pass
+    return _load_sound(audio_path, mtime).get_total_duration()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_pitch(audio_path, mtime, min_pitch, max_pitch):
+    sound = _load_sound(audio_path, mtime)
+    return sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_point_process(audio_path, mtime, min_pitch, max_pitch):
+    sound = _load_sound(audio_path, mtime)
+    pitch = _load_pitch(audio_path, mtime, min_pitch, max_pitch)
+    return parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_intensity(audio_path, mtime, time_step, min_pitch):
+    sound = _load_sound(audio_path, mtime)
+    return sound.to_intensity(time_step=time_step, minimum_pitch=min_pitch)
+
+
+def clear_cache():
+    """
+    Discard all cached Parselmouth objects.
+
+    The `measure_*` functions called with `audio_path` memoize the analyses of the most
+    recent files per (path, modification time, analysis parameters). `get_voice_report`
+    does not use this cache. Call this to release the memory held by the cache.
+
+    Example:
+        >>> from vocalysis import measure_pitch, measure_jitter, clear_cache
+        >>> pitch = measure_pitch(audio_path="path/to/speech.wav")
+        >>> jitter = measure_jitter(audio_path="path/to/speech.wav")  # reuses the cached Sound and Pitch
+        >>> clear_cache()
+    """
+    _load_sound.cache_clear()
+    _load_duration.cache_clear()
+    _load_pitch.cache_clear()
+    _load_point_process.cache_clear()
+    _load_intensity.cache_clear()
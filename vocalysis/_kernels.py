@@ -0,0 +1,186 @@
+import numpy as np
+
+# Number of spectrum bins processed at a time by the NumPy fallback of spectral_moments
+_BLOCK_SIZE = 1 << 16
+
+
+def _mean_std_loop(x):
+    # Welford's algorithm: mean and sample standard deviation in a single pass
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in x:
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    if n < 2:
+        return (mean if n == 1 else np.nan), np.nan
+    return mean, np.sqrt(m2 / (n - 1))
+
+
+def _nan_mean_std_loop(x):
+    # As _mean_std_loop, skipping NaN (undefined) values inline instead of copying the array
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in x:
+        if np.isnan(value):
+            continue
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    if n < 2:
+        return (mean if n == 1 else np.nan), np.nan
+    return mean, np.sqrt(m2 / (n - 1))
+
+
+def _spectral_moments_loop(re, im, x1, dx):
+    # Power-2 (energy weighted) frequency moments of a spectrum, defined as in Praat:
+    # a first pass for the centre of gravity, a second for the 2nd-4th central moments
+    total = 0.0
+    first = 0.0
+    for i in range(re.size):
+        energy = re[i] * re[i] + im[i] * im[i]
+        total += energy
+        first += (x1 + i * dx) * energy
+    if total == 0.0:
+        return np.nan, np.nan, np.nan, np.nan
+    centre = first / total
+
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(re.size):
+        energy = re[i] * re[i] + im[i] * im[i]
+        d = x1 + i * dx - centre
+        d2 = d * d
+        m2 += d2 * energy
+        m3 += d2 * d * energy
+        m4 += d2 * d2 * energy
+    m2 /= total
+    m3 /= total
+    m4 /= total
+    if m2 == 0.0:
+        return centre, 0.0, np.nan, np.nan
+    return centre, np.sqrt(m2), m3 / (m2 * np.sqrt(m2)), m4 / (m2 * m2) - 3.0
+
+
+def _voice_breaks_loop(pulse_times, threshold):
+    # Inter-pulse intervals longer than the threshold, counted and summed in one fused pass
+    count = 0
+    total = 0.0
+    for i in range(pulse_times.size - 1):
+        interval = pulse_times[i + 1] - pulse_times[i]
+        if interval > threshold:
+            count += 1
+            total += interval
+    return count, total
+
+
+def _mean_std_numpy(x):
+    if x.size < 2:
+        return (float(x[0]) if x.size == 1 else np.nan), np.nan
+    return float(x.mean()), float(x.std(ddof=1))
+
+
+def _nan_mean_std_numpy(x):
+    return _mean_std_numpy(x[~np.isnan(x)])
+
+
+def _spectral_moments_numpy(re, im, x1, dx):
+    # Same two passes as the loop, over fixed-size blocks of bins, so that the temporary
+    # arrays stay bounded by _BLOCK_SIZE instead of growing with the length of the recording
+    blocks = [slice(start, start + _BLOCK_SIZE) for start in range(0, re.size, _BLOCK_SIZE)]
+
+    def block_energy_and_frequencies(block):
+        energy = re[block] * re[block] + im[block] * im[block]
+        return energy, x1 + dx * np.arange(block.start, block.start + energy.size)
+
+    total = 0.0
+    first = 0.0
+    for block in blocks:
+        energy, frequencies = block_energy_and_frequencies(block)
+        total += energy.sum()
+        first += frequencies @ energy
+    if total == 0.0:
+        return np.nan, np.nan, np.nan, np.nan
+    centre = float(first / total)
+
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for block in blocks:
+        energy, frequencies = block_energy_and_frequencies(block)
+        deviation = frequencies - centre
+        weighted = deviation * deviation * energy
+        m2 += weighted.sum()
+        weighted *= deviation
+        m3 += weighted.sum()
+        m4 += weighted @ deviation
+    m2 = float(m2 / total)
+    m3 = float(m3 / total)
+    m4 = float(m4 / total)
+    if m2 == 0.0:
+        return centre, 0.0, np.nan, np.nan
+    return centre, np.sqrt(m2), m3 / (m2 * np.sqrt(m2)), m4 / (m2 * m2) - 3.0
+
+
+def _voice_breaks_numpy(pulse_times, threshold):
+    intervals = np.diff(pulse_times)
+    breaks = intervals > threshold
+    return int(np.count_nonzero(breaks)), float(intervals.sum(where=breaks))
+
+
+def median(x, overwrite_input=False):
+    # Median of the defined (non-NaN) values of a 1-D float array, equal to np.median and
+    # np.nanmedian. Partitions only around the middle element(s): np.median always selects two
+    # order statistics, and np.nanmedian first copies the defined values out. np.partition
+    # places NaNs last, so the defined values are the first `n` of the partitioned array.
+    # With `overwrite_input`, `x` is partitioned in place (only for private copies).
+    n = x.size - int(np.count_nonzero(np.isnan(x)))
+    if n == 0:
+        return np.nan
+    k = n // 2
+    kth = k if n % 2 else (k - 1, k)
+    if overwrite_input:
+        x.partition(kth)
+    else:
+        x = np.partition(x, kth)
+    return float(x[k]) if n % 2 else 0.5 * (x[k - 1] + x[k])
+
+
+# Kernels exported by this module, as (Numba loop, NumPy fallback) pairs:
+#   mean_std(x) -> (mean, std): mean and sample standard deviation (n - 1 denominator,
+#       as in Praat) of a 1-D float array, NaN where undefined.
+#   nan_mean_std(x) -> (mean, std): the same, ignoring NaN values in `x`.
+#   spectral_moments(re, im, x1, dx) -> (centre of gravity, std, skewness, kurtosis) of a
+#       spectrum with real/imaginary parts `re`/`im` and bin frequencies x1 + i * dx, equal
+#       to Praat's power-2 Spectrum queries but in two passes instead of one or more per query.
+#   voice_breaks(pulse_times, threshold) -> (count, total duration) of the intervals between
+#       consecutive pulse times that exceed `threshold`.
+_KERNELS = {
+    'mean_std': (_mean_std_loop, _mean_std_numpy),
+    'nan_mean_std': (_nan_mean_std_loop, _nan_mean_std_numpy),
+    'spectral_moments': (_spectral_moments_loop, _spectral_moments_numpy),
+    'voice_breaks': (_voice_breaks_loop, _voice_breaks_numpy),
+}
+
+
+def __getattr__(name):
+    # Importing Numba takes longer than importing the rest of the package, so it is only
+    # imported (and a kernel compiled) the first time that kernel is used. Without Numba,
+    # the NumPy fallback is used instead.
+    try:
+        loop, fallback = _KERNELS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        import numba
+    except ImportError:
+        kernel = fallback
+    else:
+        kernel = numba.njit(cache=True)(loop)
+    globals()[name] = kernel
+    return kernel
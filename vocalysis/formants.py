@@ -1,6 +1,9 @@
 import parselmouth
 
-def measure_formant_statistics(audio_path=None, sound_object=None, formant_ceiling=5500.0):
+from ._cache import _file_key, _load_sound
+from .formatting import _format_measures, _FORMANT_FORMATS
+
+def measure_formant_statistics(audio_path=None, sound_object=None, formant_ceiling=5500.0, as_string=True):
     """
     Measure statistics for the first four formants (F1–F4), including mean, standard deviation, minimum, maximum,
     median, and median bandwidth, from an audio file or a Parselmouth Sound object.
@@ -9,10 +12,13 @@ def measure_formant_statistics(audio_path=None, sound_object=None, formant_ceili
         audio_path (str, optional): Path to a WAV or other supported audio file.
         sound_object (parselmouth.Sound, optional): A preloaded Parselmouth Sound object.
         formant_ceiling (float, optional): Maximum formant frequency in Hz. Defaults to 5500.0.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: A dictionary with keys such as 'F1_mean', 'F1_std', 'F1_min', 'F1_max',
-              'F1_median', and 'F1_bandwidth_median' for each of the first four formants.
+              'F1_median', and 'F1_bandwidth_median' for each of the first four formants, in Hz.
 
     Example:
         >>> from vocalysis import measure_formant_statistics
@@ -23,11 +29,13 @@ def measure_formant_statistics(audio_path=None, sound_object=None, formant_ceili
     if sound_object is not None:
         snd = sound_object
     elif audio_path is not None:
-        snd = parselmouth.Sound(audio_path)
+        snd = _load_sound(*_file_key(audio_path))
     else:
         raise ValueError("Provide either 'audio_path' or 'sound_object'.")
 
-    formants = parselmouth.praat.call(snd, "To Formant (burg)", 0, 5, formant_ceiling, 0.025, 50)
+    formants = snd.to_formant_burg(
+        max_number_of_formants=5, maximum_formant=formant_ceiling, window_length=0.025, pre_emphasis_from=50
+    )
     stats = {}
     for i in range(1, 5):  # F1 to F4
         try:
@@ -40,11 +48,11 @@ def measure_formant_statistics(audio_path=None, sound_object=None, formant_ceili
         except RuntimeError:
             mean = stdev = minimum = maximum = median = bw_median = float("nan")
 
-        stats[f"F{i}_mean"] = f"{mean:.2f} Hz"
-        stats[f"F{i}_std"] = f"{stdev:.2f} Hz"
-        stats[f"F{i}_min"] = f"{minimum:.2f} Hz"
-        stats[f"F{i}_max"] = f"{maximum:.2f} Hz"
-        stats[f"F{i}_median"] = f"{median:.2f} Hz"
-        stats[f"F{i}_bandwidth_median"] = f"{bw_median:.2f} Hz"
+        stats[f"F{i}_mean"] = mean
+        stats[f"F{i}_std"] = stdev
+        stats[f"F{i}_min"] = minimum
+        stats[f"F{i}_max"] = maximum
+        stats[f"F{i}_median"] = median
+        stats[f"F{i}_bandwidth_median"] = bw_median
 
-    return stats
+    return _format_measures(stats, _FORMANT_FORMATS) if as_string else stats
@@ -0,0 +1,105 @@
+# Measure key -> (unit suffix, scale factor, decimals) of its string form, per measure group.
+# Keys missing from a table (e.g. pulse counts) are passed through unchanged.
+_PITCH_FORMATS = {key: (" Hz", 1, 3) for key in ('median', 'mean', 'std', 'min', 'max')}
+_PULSES_FORMATS = {
+    'mean_period': (" seconds", 1, 10),
+    'std_period': (" seconds", 1, 10),
+}
+_VOICING_FORMATS = {
+    'unvoiced_fraction': ("%", 100, 3),
+    'degree_voice_breaks': ("%", 100, 3),
+}
+_JITTER_FORMATS = {
+    'jitter_local': ("%", 100, 3),
+    'jitter_local_absolute': ("", 1, 6),
+    'jitter_rap': ("%", 100, 3),
+    'jitter_ppq5': ("%", 100, 3),
+    'jitter_ddp': ("%", 100, 3),
+}
+_SHIMMER_FORMATS = {
+    'shimmer_local': ("%", 100, 3),
+    'shimmer_local_dB': (" dB", 1, 3),
+    'shimmer_apq3': ("%", 100, 3),
+    'shimmer_apq5': ("%", 100, 3),
+    'shimmer_apq11': ("%", 100, 3),
+    'shimmer_dda': ("%", 100, 3),
+}
+_INTENSITY_FORMATS = {
+    key: (" dB", 1, 3)
+    for key in ('intensity_median', 'intensity_mean', 'intensity_std', 'intensity_min', 'intensity_max')
+}
+_SPECTRAL_SHAPE_FORMATS = {
+    'center_of_gravity': (" Hz", 1, 2),
+    'std': (" Hz", 1, 2),
+    'skewness': ("", 1, 3),
+    'kurtosis': ("", 1, 3),
+}
+_FORMANT_FORMATS = {
+    f"F{i}_{stat}": (" Hz", 1, 2)
+    for i in range(1, 5)
+    for stat in ('mean', 'std', 'min', 'max', 'median', 'bandwidth_median')
+}
+
+_ALL_FORMATS = (
+    _PITCH_FORMATS, _PULSES_FORMATS, _VOICING_FORMATS, _JITTER_FORMATS, _SHIMMER_FORMATS,
+    _INTENSITY_FORMATS, _SPECTRAL_SHAPE_FORMATS, _FORMANT_FORMATS,
+)
+
+
+def _format_measures(measures, formats, precision=None):
+    """
+    Format the numeric values of a flat measure dict according to `formats`.
+
+    None values and keys without a format (such as counts) are returned unchanged.
+    `precision`, if given, overrides the number of decimals of every formatted value.
+    """
+    formatted = {}
+    for key, value in measures.items():
+        if value is None or key not in formats:
+            formatted[key] = value
+            continue
+        unit, scale, decimals = formats[key]
+        if precision is not None:
+            decimals = precision
+        formatted[key] = f"{value * scale:.{decimals}f}{unit}"
+    return formatted
+
+
+def _find_formats(measures):
+    # The measure group is the one whose table covers most keys ('std' alone is ambiguous)
+    formats = max(_ALL_FORMATS, key=lambda table: len(measures.keys() & table.keys()))
+    return formats if measures.keys() & formats.keys() else {}
+
+
+def format_report(report, precision=None):
+    """
+    Convert numeric measures into strings with units, as displayed by Praat.
+
+    Accepts the dictionary returned by any `measure_*` function or by `get_voice_report`
+    (called with `as_string=False`). Nested dictionaries are formatted recursively.
+    Fractions are shown as percentages (e.g. 0.02307 -> "2.307%"), frequencies in Hz,
+    intensities and shimmer (dB) in dB, and periods in seconds.
+
+    Args:
+        report (dict): Numeric measures, possibly nested (as returned by `get_voice_report`).
+        precision (int, optional): Number of decimals for every value. Defaults to None,
+            which uses each measure's usual precision (e.g. 3 decimals for pitch, 10 for periods).
+
+    Returns:
+        dict: A dictionary with the same structure, in which numeric measures are replaced by
+        formatted strings. Counts and None values are left unchanged.
+
+    Example:
+        >>> from vocalysis import get_voice_report, format_report
+        >>> report = get_voice_report(audio_path="path/to/speech.wav", as_string=False)
+        >>> print(report["Jitter"]["jitter_local"])
+        0.04123
+        >>> print(format_report(report)["Jitter"]["jitter_local"])
+        '4.123%'
+    """
+    if any(isinstance(value, dict) for value in report.values()):
+        return {
+            key: format_report(value, precision) if isinstance(value, dict) else value
+            for key, value in report.items()
+        }
+    return _format_measures(report, _find_formats(report), precision)
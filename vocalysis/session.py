@@ -0,0 +1,110 @@
+from functools import cached_property
+
+import parselmouth
+
+from .formants import measure_formant_statistics
+from .spectral_shape import measure_spectral_shape
+from .voice_report import (
+    _voice_report_from_objects, measure_intensity, measure_jitter, measure_pitch, measure_pulses, measure_shimmer,
+    measure_voicing
+)
+
+
+class VocalysisSession:
+    """
+    Analyse one audio file with several measures, computing each Parselmouth object only once.
+
+    The Sound, Pitch, PointProcess and Intensity objects are built lazily, the first time a
+    measure needs them, and kept for the lifetime of the session. They belong to the session
+    alone (they are not shared with the cache behind `measure_*(audio_path=...)`), so changing
+    one of them in place, e.g. with `scale_intensity`, only affects later measures of this session.
+
+    Args:
+        audio_path (str): Path to an audio file (WAV or other Parselmouth-supported format).
+        min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
+        max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        time_step (float, optional): Time step in seconds for intensity analysis. Defaults to 0.01.
+
+    Example:
+        >>> from vocalysis import VocalysisSession
+        >>> session = VocalysisSession("path/to/speech.wav")
+        >>> print(session.pitch()["mean"])
+        '142.537 Hz'
+        >>> print(session.jitter()["jitter_local"])
+        '4.123%'
+    """
+
+    def __init__(self, audio_path, min_pitch=75, max_pitch=500, time_step=0.01):
+        self.audio_path = audio_path
+        self.min_pitch = min_pitch
+        self.max_pitch = max_pitch
+        self.time_step = time_step
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}({self.audio_path!r}, min_pitch={self.min_pitch!r}, "
+            f"max_pitch={self.max_pitch!r}, time_step={self.time_step!r})"
+        )
+
+    @cached_property
+    def sound_object(self):
+        """parselmouth.Sound: The decoded audio file."""
+        return parselmouth.Sound(self.audio_path)
+
+    @cached_property
+    def pitch_object(self):
+        """parselmouth.Pitch: Pitch analysis between `min_pitch` and `max_pitch`."""
+        return self.sound_object.to_pitch(pitch_floor=self.min_pitch, pitch_ceiling=self.max_pitch)
+
+    @cached_property
+    def point_process(self):
+        """parselmouth.Data: Glottal pulses ("To PointProcess (cc)") of the sound and pitch."""
+        return parselmouth.praat.call([self.sound_object, self.pitch_object], "To PointProcess (cc)")
+
+    @cached_property
+    def intensity_object(self):
+        """parselmouth.Intensity: Intensity contour with step `time_step`."""
+        return self.sound_object.to_intensity(time_step=self.time_step, minimum_pitch=self.min_pitch)
+
+    def pitch(self, as_string=True):
+        """Return `measure_pitch` for this file."""
+        return measure_pitch(pitch_object=self.pitch_object, as_string=as_string)
+
+    def pulses(self, as_string=True):
+        """Return `measure_pulses` for this file."""
+        return measure_pulses(point_process=self.point_process, as_string=as_string)
+
+    def voicing(self, as_string=True):
+        """Return `measure_voicing` for this file."""
+        return measure_voicing(
+            point_process=self.point_process, pitch_object=self.pitch_object, sound_object=self.sound_object,
+            as_string=as_string
+        )
+
+    def jitter(self, as_string=True):
+        """Return `measure_jitter` for this file."""
+        return measure_jitter(point_process=self.point_process, as_string=as_string)
+
+    def shimmer(self, as_string=True):
+        """Return `measure_shimmer` for this file."""
+        return measure_shimmer(point_process=self.point_process, sound_object=self.sound_object, as_string=as_string)
+
+    def intensity(self, as_string=True):
+        """Return `measure_intensity` for this file."""
+        return measure_intensity(intensity_object=self.intensity_object, as_string=as_string)
+
+    def spectral_shape(self, as_string=True):
+        """Return `measure_spectral_shape` for this file."""
+        return measure_spectral_shape(sound_object=self.sound_object, as_string=as_string)
+
+    def formant_statistics(self, formant_ceiling=5500.0, as_string=True):
+        """Return `measure_formant_statistics` for this file."""
+        return measure_formant_statistics(
+            sound_object=self.sound_object, formant_ceiling=formant_ceiling, as_string=as_string
+        )
+
+    def voice_report(self, as_string=True):
+        """Return the same dictionary as `get_voice_report` for this file."""
+        return _voice_report_from_objects(
+            self.sound_object, self.pitch_object, self.point_process, self.intensity_object, as_string=as_string
+        )
@@ -1,17 +1,24 @@
 import parselmouth
 
+from ._cache import _file_key, _load_sound
+from . import _kernels
+from .formatting import _format_measures, _SPECTRAL_SHAPE_FORMATS
 
-def measure_spectral_shape(audio_path=None, sound_object=None):
+
+def measure_spectral_shape(audio_path=None, sound_object=None, as_string=True):
     """
     Measure spectral shape descriptors from an audio file or Parselmouth Sound object.
 
     Args:
         audio_path (str, optional): Path to an audio file.
         sound_object (parselmouth.Sound, optional): A precomputed sound object.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Spectral shape statistics:
-            'center_of_gravity', 'std', 'skewness', 'kurtosis'
+            'center_of_gravity', 'std' (both in Hz), 'skewness', 'kurtosis'
 
     Example:
         >>> from vocalysis import measure_spectral_shape
@@ -22,21 +29,23 @@ def measure_spectral_shape(audio_path=None, sound_object=None):
     if sound_object is not None:
         snd = sound_object
     elif audio_path is not None:
-        snd = parselmouth.Sound(audio_path)
+        snd = _load_sound(*_file_key(audio_path))
     else:
         raise ValueError("Either 'audio_path' or 'sound_object' must be provided.")
 
     spectrum = snd.to_spectrum()  # Equivalent to: parselmouth.praat.call(snd, "To Spectrum", "yes")
 
-    center_of_gravity = parselmouth.praat.call(spectrum, "Get centre of gravity", 2)
-    spread = parselmouth.praat.call(spectrum, "Get standard deviation", 2)
-    skewness = parselmouth.praat.call(spectrum, "Get skewness", 2)
-    kurt = parselmouth.praat.call(spectrum, "Get kurtosis", 2)
+    # Equivalent to Praat's "Get centre of gravity", "Get standard deviation", "Get skewness"
+    # and "Get kurtosis" with power 2, computed together in two passes over the spectrum
+    values = spectrum.values
+    center_of_gravity, spread, skewness, kurt = _kernels.spectral_moments(values[0], values[1], spectrum.x1, spectrum.dx)
 
-    return {
-        'center_of_gravity': f"{center_of_gravity:.2f} Hz",
-        'std': f"{spread:.2f} Hz",
-        'skewness': f"{skewness:.3f}",
-        'kurtosis': f"{kurt:.3f}"
+    stats = {
+        'center_of_gravity': float(center_of_gravity),
+        'std': float(spread),
+        'skewness': float(skewness),
+        'kurtosis': float(kurt)
     }
 
+    return _format_measures(stats, _SPECTRAL_SHAPE_FORMATS) if as_string else stats
+
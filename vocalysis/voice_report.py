@@ -1,8 +1,89 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import parselmouth
 import numpy as np
 
+from ._cache import _file_key, _load_duration, _load_intensity, _load_pitch, _load_point_process, _load_sound
+from . import _kernels
+from .formatting import (
+    _format_measures, _INTENSITY_FORMATS, _JITTER_FORMATS, _PITCH_FORMATS, _PULSES_FORMATS, _SHIMMER_FORMATS,
+    _VOICING_FORMATS
+)
+
+
+def _get_pulse_times(point_process):
+    """
+    Return the pulse times of a PointProcess as a float64 NumPy array.
+
+    The times are fetched with a single "To Matrix" conversion instead of one
+    "Get time from index" call per pulse.
+    """
+    num_pulses = parselmouth.praat.call(point_process, "Get number of points")
+    if num_pulses == 0:
+        return np.empty(0, dtype=np.float64)
+    try:
+        return parselmouth.praat.call(point_process, "To Matrix").values.ravel()
+    except parselmouth.PraatError:
+        # Fall back to one query per pulse, filling a preallocated buffer
+        pulse_times = np.empty(num_pulses, dtype=np.float64)
+        for i in range(num_pulses):
+            pulse_times[i] = parselmouth.praat.call(point_process, "Get time from index", i + 1)
+        return pulse_times
+
+
+# Period and amplitude settings shared by the period, jitter and shimmer measures
+_PERIOD_FLOOR = 0.0001
+_PERIOD_CEILING = 0.02
+_MAX_PERIOD_FACTOR = 1.3
+_MAX_AMPLITUDE_FACTOR = 1.6
+
+# Output key -> Praat command
+_JITTER_MEASURES = {
+    'jitter_local': "Get jitter (local)",
+    'jitter_local_absolute': "Get jitter (local, absolute)",
+    'jitter_rap': "Get jitter (rap)",
+    'jitter_ppq5': "Get jitter (ppq5)",
+    'jitter_ddp': "Get jitter (ddp)",
+}
+_SHIMMER_MEASURES = {
+    'shimmer_local': "Get shimmer (local)",
+    'shimmer_local_dB': "Get shimmer (local_dB)",
+    'shimmer_apq3': "Get shimmer (apq3)",
+    'shimmer_apq5': "Get shimmer (apq5)",
+    'shimmer_apq11': "Get shimmer (apq11)",
+    'shimmer_dda': "Get shimmer (dda)",
+}
+
+
+def _get_jitter_values(point_process):
+    return {
+        key: parselmouth.praat.call(point_process, command, 0, 0, _PERIOD_FLOOR, _PERIOD_CEILING, _MAX_PERIOD_FACTOR)
+        for key, command in _JITTER_MEASURES.items()
+    }
+
 
-def measure_pitch(audio_path=None, sound_object=None, pitch_object=None, min_pitch=75, max_pitch=500):
+def _get_shimmer_values(sound, point_process):
+    """
+    Return all shimmer measures of `sound` at the pulses of `point_process`.
+
+    The peak amplitude of every period is read from the Sound once, into an AmplitudeTier,
+    and each shimmer variant is computed from that tier. This is how Praat's own
+    "Get shimmer" commands on a Sound and PointProcess work, so the values are identical.
+    """
+    try:
+        amplitude_tier = parselmouth.praat.call(
+            [sound, point_process], "To AmplitudeTier (period)", 0, 0, _PERIOD_FLOOR, _PERIOD_CEILING, _MAX_PERIOD_FACTOR
+        )
+    except parselmouth.PraatError:  # Fewer than 3 pulses: shimmer is undefined
+        return {key: float('nan') for key in _SHIMMER_MEASURES}
+    return {
+        key: parselmouth.praat.call(amplitude_tier, command, _PERIOD_FLOOR, _PERIOD_CEILING, _MAX_AMPLITUDE_FACTOR)
+        for key, command in _SHIMMER_MEASURES.items()
+    }
+
+
+def measure_pitch(audio_path=None, sound_object=None, pitch_object=None, min_pitch=75, max_pitch=500, as_string=True):
     """
     Compute basic pitch statistics (in Hz) from an audio file or Parselmouth object.
 
@@ -16,10 +97,14 @@ def measure_pitch(audio_path=None, sound_object=None, pitch_object=None, min_pit
         pitch_object (parselmouth.Pitch, optional): A precomputed pitch object.
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Pitch statistics over voiced frames with keys:
-            'median', 'mean', 'std', 'min', and 'max' (all as strings, e.g. "142.537 Hz").
+            'median', 'mean', 'std', 'min', and 'max', in Hz (as strings such as
+            "142.537 Hz" if `as_string` is True).
             If no voiced frames are found, all values are None.
     
     Example:
@@ -33,17 +118,22 @@ def measure_pitch(audio_path=None, sound_object=None, pitch_object=None, min_pit
     elif sound_object is not None:
         pitch = sound_object.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
     elif audio_path is not None:
-        sound = parselmouth.Sound(audio_path)
-        pitch = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
+        pitch = _load_pitch(*_file_key(audio_path), min_pitch, max_pitch)
     else:
         raise ValueError("Either 'audio_path', 'sound_object', or 'pitch_object' must be provided.")
 
+    voiced = pitch.selected_array['frequency']
+    voiced = voiced[voiced > 0]
+
     try:
-        mean = parselmouth.praat.call(pitch, "Get mean", 0, 0, "Hertz")
-        stdev = parselmouth.praat.call(pitch, "Get standard deviation", 0, 0, "Hertz")
+        if voiced.size == 0:
+            raise RuntimeError("No voiced frames.")
+        # Mean, standard deviation and median over voiced frames equal Praat's "Get mean",
+        # "Get standard deviation" and "Get quantile"; the extrema keep Praat's parabolic interpolation
+        mean, stdev = _kernels.mean_std(voiced)
+        median = _kernels.median(voiced, overwrite_input=True)  # `voiced` is a private copy
         minimum = parselmouth.praat.call(pitch, "Get minimum", 0, 0, "Hertz", "Parabolic")
         maximum = parselmouth.praat.call(pitch, "Get maximum", 0, 0, "Hertz", "Parabolic")
-        median = parselmouth.praat.call(pitch, "Get quantile", 0, 0, 0.5, "Hertz")
     except RuntimeError:
         return {
             'median': None,
@@ -53,16 +143,18 @@ def measure_pitch(audio_path=None, sound_object=None, pitch_object=None, min_pit
             'max': None
         }
 
-    return {
-        'median': f"{median:.3f} Hz",
-        'mean': f"{mean:.3f} Hz",
-        'std': f"{stdev:.3f} Hz",
-        'min': f"{minimum:.3f} Hz",
-        'max': f"{maximum:.3f} Hz"
+    stats = {
+        'median': float(median),
+        'mean': float(mean),
+        'std': float(stdev),
+        'min': minimum,
+        'max': maximum
     }
 
+    return _format_measures(stats, _PITCH_FORMATS) if as_string else stats
 
-def measure_pulses(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500):
+
+def measure_pulses(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500, as_string=True):
     """
     Compute pulse-related statistics from an audio file or Parselmouth object.
 
@@ -77,13 +169,17 @@ def measure_pulses(audio_path=None, sound_object=None, pitch_object=None, point_
         point_process (parselmouth.PointProcess, optional): A precomputed point process object.
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Pulse statistics with the following keys:
             - 'num_pulses': Total number of pulses.
             - 'num_periods': Number of periods between pulses.
-            - 'mean_period': Mean period in seconds (as string), or `None` if not computable.
-            - 'std_period': Standard deviation of period in seconds (as string), or `None`.
+            - 'mean_period': Mean period in seconds, or `None` if not computable.
+            - 'std_period': Standard deviation of period in seconds, or `None`.
+            Periods are strings such as '0.0050364095 seconds' if `as_string` is True.
 
     Example:
         >>> from vocalysis import measure_pulses
@@ -95,12 +191,15 @@ def measure_pulses(audio_path=None, sound_object=None, pitch_object=None, point_
     # Step 1: Use the given PointProcess if available
     if point_process is not None:
         pass  # Use it directly
+    elif sound_object is None and pitch_object is None and audio_path is not None:
+        # Only a file path: reuse the cached PointProcess of that file
+        point_process = _load_point_process(*_file_key(audio_path), min_pitch, max_pitch)
     else:
         # Step 2: Ensure we have a sound object
         if sound_object is not None:
             sound = sound_object
         elif audio_path is not None:
-            sound = parselmouth.Sound(audio_path)
+            sound = _load_sound(*_file_key(audio_path))
         else:
             raise ValueError("To compute point_process, either 'sound_object' or 'audio_path' must be provided.")
 
@@ -115,26 +214,26 @@ def measure_pulses(audio_path=None, sound_object=None, pitch_object=None, point_
 
     # Step 5: Pulse statistics
     num_pulses = parselmouth.praat.call(point_process, "Get number of points")
-    pulse_times = [parselmouth.praat.call(point_process, "Get time from index", i + 1) for i in range(num_pulses)]
-    periods = np.diff(pulse_times)
-    num_periods = len(periods)
+    num_periods = max(num_pulses - 1, 0)
 
     if num_periods > 0:
-        mean_period = parselmouth.praat.call(point_process, "Get mean period", 0, 0, 0.0001, 0.02, 1.3)
-        std_period = parselmouth.praat.call(point_process, "Get stdev period", 0, 0, 0.0001, 0.02, 1.3)
+        mean_period = parselmouth.praat.call(point_process, "Get mean period", 0, 0, _PERIOD_FLOOR, _PERIOD_CEILING, _MAX_PERIOD_FACTOR)
+        std_period = parselmouth.praat.call(point_process, "Get stdev period", 0, 0, _PERIOD_FLOOR, _PERIOD_CEILING, _MAX_PERIOD_FACTOR)
     else:
         mean_period = None
         std_period = None
 
-    return {
+    stats = {
         'num_pulses': num_pulses,
         'num_periods': num_periods,
-        'mean_period': f"{mean_period:.10f} seconds" if mean_period is not None else None,
-        'std_period': f"{std_period:.10f} seconds" if std_period is not None else None
+        'mean_period': mean_period,
+        'std_period': std_period
     }
 
+    return _format_measures(stats, _PULSES_FORMATS) if as_string else stats
+
 
-def measure_voicing(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500):
+def measure_voicing(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500, as_string=True):
     """
     Compute voicing statistics from an audio file or Parselmouth objects.
 
@@ -149,12 +248,16 @@ def measure_voicing(audio_path=None, sound_object=None, pitch_object=None, point
         point_process (parselmouth.PointProcess, optional): A precomputed point process.
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Voicing statistics with the following keys:
-            - 'unvoiced_fraction': Percentage of unvoiced frames (as string, e.g., '12.345%').
+            - 'unvoiced_fraction': Fraction of unvoiced frames (e.g., 0.12345, or '12.345%' as string).
             - 'num_voice_breaks': Number of detected voice breaks.
-            - 'degree_voice_breaks': Total duration of voice breaks as a percentage of signal duration (e.g., '4.789%').
+            - 'degree_voice_breaks': Total duration of voice breaks as a fraction of signal duration
+              (e.g., 0.04789, or '4.789%' as string).
 
     Example:
         >>> from vocalysis import measure_voicing
@@ -165,54 +268,52 @@ def measure_voicing(audio_path=None, sound_object=None, pitch_object=None, point
     if point_process is not None:
         if pitch_object is None:
             raise ValueError("If 'point_process' is provided, 'pitch_object' must also be provided.")
-        # Assume sound is needed for total duration
+        # Only the total duration is needed from the sound; for a file, avoid decoding it
         if sound_object is None:
             if audio_path is None:
                 raise ValueError("If 'point_process' is provided, either 'sound_object' or 'audio_path' must also be provided.")
-            sound = parselmouth.Sound(audio_path)
+            analysis_duration = _load_duration(*_file_key(audio_path))
         else:
-            sound = sound_object
+            analysis_duration = sound_object.get_total_duration()
         pitch = pitch_object
     else:
         if sound_object is not None:
             sound = sound_object
+            pitch = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
+            point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
         elif audio_path is not None:
-            sound = parselmouth.Sound(audio_path)
+            key = _file_key(audio_path)
+            sound = _load_sound(*key)
+            pitch = _load_pitch(*key, min_pitch, max_pitch)
+            point_process = _load_point_process(*key, min_pitch, max_pitch)
         else:
             raise ValueError("To compute 'point_process', either 'sound_object' or 'audio_path' must be provided.")
-
-        pitch = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
-        point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
+        analysis_duration = sound.get_total_duration()
 
     # Fraction of unvoiced frames
     total_frames = pitch.get_number_of_frames()
     voiced_frames = pitch.count_voiced_frames()
-    unvoiced_fraction = (1 - (voiced_frames / total_frames)) * 100 if total_frames > 0 else None
+    unvoiced_fraction = 1 - (voiced_frames / total_frames) if total_frames > 0 else None
 
     # Pulse times
-    num_pulses = parselmouth.praat.call(point_process, "Get number of points")
-    pulse_times = [parselmouth.praat.call(point_process, "Get time from index", i + 1) for i in range(num_pulses)]
-
-    # Intervals
-    inter_pulse_intervals = [
-        pulse_times[i+1] - pulse_times[i] for i in range(len(pulse_times) - 1)
-    ]
+    pulse_times = _get_pulse_times(point_process)
 
+    # Intervals between consecutive pulses longer than the threshold are voice breaks
     voice_break_threshold = 1.25 / min_pitch
-    num_voice_breaks = sum(interval > voice_break_threshold for interval in inter_pulse_intervals)
-    total_break_duration = sum(interval for interval in inter_pulse_intervals if interval > voice_break_threshold)
+    num_voice_breaks, total_break_duration = _kernels.voice_breaks(pulse_times, voice_break_threshold)
 
-    analysis_duration = sound.get_total_duration()
-    degree_voice_breaks = (total_break_duration / analysis_duration) * 100 if analysis_duration > 0 else None
+    degree_voice_breaks = total_break_duration / analysis_duration if analysis_duration > 0 else None
 
-    return {
-        'unvoiced_fraction': f"{unvoiced_fraction:.3f}%" if unvoiced_fraction is not None else None,
+    stats = {
+        'unvoiced_fraction': unvoiced_fraction,
         'num_voice_breaks': num_voice_breaks,
-        'degree_voice_breaks': f"{degree_voice_breaks:.3f}%" if degree_voice_breaks is not None else None,
+        'degree_voice_breaks': degree_voice_breaks,
     }
 
+    return _format_measures(stats, _VOICING_FORMATS) if as_string else stats
 
-def measure_jitter(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=600):
+
+def measure_jitter(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=600, as_string=True):
     """
     Measure jitter statistics from an audio file or Parselmouth object.
 
@@ -227,11 +328,15 @@ def measure_jitter(audio_path=None, sound_object=None, pitch_object=None, point_
         point_process (parselmouth.PointProcess, optional): A precomputed point process object.
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 600.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Jitter statistics with keys:
             'jitter_local', 'jitter_local_absolute', 'jitter_rap', 'jitter_ppq5', and 'jitter_ddp'.
-            All values are strings formatted as percentages or seconds (e.g. "3.141%").
+            Relative measures are fractions and 'jitter_local_absolute' is in seconds. If `as_string`
+            is True, values are strings formatted as percentages or seconds (e.g. "3.141%").
 
     Example:
         >>> from vocalysis import measure_jitter
@@ -243,12 +348,15 @@ def measure_jitter(audio_path=None, sound_object=None, pitch_object=None, point_
     # Step 1: Use provided PointProcess if available
     if point_process is not None:
         pass  # Use directly
+    elif sound_object is None and pitch_object is None and audio_path is not None:
+        # Only a file path: reuse the cached PointProcess of that file
+        point_process = _load_point_process(*_file_key(audio_path), min_pitch, max_pitch)
     else:
         # Step 2: Ensure we have a sound object
         if sound_object is not None:
             sound = sound_object
         elif audio_path is not None:
-            sound = parselmouth.Sound(audio_path)
+            sound = _load_sound(*_file_key(audio_path))
         else:
             raise ValueError("To compute point_process, either 'sound_object' or 'audio_path' must be provided.")
 
@@ -262,16 +370,12 @@ def measure_jitter(audio_path=None, sound_object=None, pitch_object=None, point_
         point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
 
     # Step 5: Extract jitter measures
-    return {
-        'jitter_local': f"{parselmouth.praat.call(point_process, 'Get jitter (local)', 0, 0, 0.0001, 0.02, 1.3) * 100:.3f}%",
-        'jitter_local_absolute': f"{parselmouth.praat.call(point_process, 'Get jitter (local, absolute)', 0, 0, 0.0001, 0.02, 1.3):.6f}",
-        'jitter_rap': f"{parselmouth.praat.call(point_process, 'Get jitter (rap)', 0, 0, 0.0001, 0.02, 1.3) * 100:.3f}%",
-        'jitter_ppq5': f"{parselmouth.praat.call(point_process, 'Get jitter (ppq5)', 0, 0, 0.0001, 0.02, 1.3) * 100:.3f}%",
-        'jitter_ddp': f"{parselmouth.praat.call(point_process, 'Get jitter (ddp)', 0, 0, 0.0001, 0.02, 1.3) * 100:.3f}%"
-    }
+    jitter = _get_jitter_values(point_process)
 
+    return _format_measures(jitter, _JITTER_FORMATS) if as_string else jitter
 
-def measure_shimmer(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500):
+
+def measure_shimmer(audio_path=None, sound_object=None, pitch_object=None, point_process=None, min_pitch=75, max_pitch=500, as_string=True):
     """
     Measure shimmer statistics from an audio file or Parselmouth object.
 
@@ -286,12 +390,16 @@ def measure_shimmer(audio_path=None, sound_object=None, pitch_object=None, point
         point_process (parselmouth.PointProcess, optional): A precomputed point process object.
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: Shimmer statistics with keys:
             'shimmer_local', 'shimmer_local_dB', 'shimmer_apq3', 'shimmer_apq5',
-            'shimmer_apq11', and 'shimmer_dda'. All values are strings formatted as
-            percentages or decibels (e.g. "3.141%" or "0.123 dB").
+            'shimmer_apq11', and 'shimmer_dda'. Relative measures are fractions and
+            'shimmer_local_dB' is in dB. If `as_string` is True, values are strings formatted
+            as percentages or decibels (e.g. "3.141%" or "0.123 dB").
 
     Example:
         >>> from vocalysis import measure_shimmer
@@ -302,17 +410,22 @@ def measure_shimmer(audio_path=None, sound_object=None, pitch_object=None, point
     # Step 1: Use provided PointProcess if available
     if point_process is not None:
         if sound_object is None and audio_path is not None:
-            sound = parselmouth.Sound(audio_path)
+            sound = _load_sound(*_file_key(audio_path))
         elif sound_object is not None:
             sound = sound_object
         else:
             raise ValueError("When providing a point_process, either 'sound_object' or 'audio_path' must also be provided.")
+    elif sound_object is None and pitch_object is None and audio_path is not None:
+        # Only a file path: reuse the cached analyses of that file
+        key = _file_key(audio_path)
+        sound = _load_sound(*key)
+        point_process = _load_point_process(*key, min_pitch, max_pitch)
     else:
         # Step 2: Ensure we have a sound object
         if sound_object is not None:
             sound = sound_object
         elif audio_path is not None:
-            sound = parselmouth.Sound(audio_path)
+            sound = _load_sound(*_file_key(audio_path))
         else:
             raise ValueError("To compute point_process, either 'sound_object' or 'audio_path' must be provided.")
 
@@ -326,48 +439,57 @@ def measure_shimmer(audio_path=None, sound_object=None, pitch_object=None, point
         point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
 
     # Step 5: Extract shimmer measures
-    shimmer_measures = {
-        'shimmer_local': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (local)', 0, 0, 0.0001, 0.02, 1.3, 1.6) * 100:.3f}%",
-        'shimmer_local_dB': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (local_dB)', 0, 0, 0.0001, 0.02, 1.3, 1.6):.3f} dB",
-        'shimmer_apq3': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (apq3)', 0, 0, 0.0001, 0.02, 1.3, 1.6) * 100:.3f}%",
-        'shimmer_apq5': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (apq5)', 0, 0, 0.0001, 0.02, 1.3, 1.6) * 100:.3f}%",
-        'shimmer_apq11': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (apq11)', 0, 0, 0.0001, 0.02, 1.3, 1.6) * 100:.3f}%",
-        'shimmer_dda': f"{parselmouth.praat.call([sound, point_process], 'Get shimmer (dda)', 0, 0, 0.0001, 0.02, 1.3, 1.6) * 100:.3f}%"
-    }
+    shimmer = _get_shimmer_values(sound, point_process)
 
-    return shimmer_measures
+    return _format_measures(shimmer, _SHIMMER_FORMATS) if as_string else shimmer
 
 
-def measure_intensity(audio_path=None, sound_object=None, intensity_object=None, time_step=0.01, min_pitch=75.0):
+def measure_intensity(audio_path=None, sound_object=None, intensity_object=None, time_step=0.01, min_pitch=75.0, as_string=True):
     """
-    Measure intensity statistics (in dB) from an audio file or Parselmouth object using only Praat calls.
+    Measure intensity statistics (in dB) from an audio file or Parselmouth object.
 
     One of `audio_path`, `sound_object`, or `intensity_object` must be provided.
     If multiple are given, the function uses the first available in this order:
     `intensity_object` > `sound_object` > `audio_path`.
 
+    Args:
+        audio_path (str, optional): Path to an audio file (WAV or other Parselmouth-supported format).
+        sound_object (parselmouth.Sound, optional): A precomputed sound object.
+        intensity_object (parselmouth.Intensity, optional): A precomputed intensity object.
+        time_step (float, optional): Time step in seconds for the intensity analysis. Defaults to 0.01.
+        min_pitch (float, optional): Minimum pitch in Hz, which sets the analysis window. Defaults to 75.
+        as_string (bool, optional): If True, return values as strings with units (see
+            `vocalysis.format_report`); if False, return plain numbers. Defaults to True;
+            the default will change to False in the next minor version.
+
     Returns:
         dict: Intensity statistics with keys:
             'intensity_median', 'intensity_mean', 'intensity_std',
-            'intensity_min', and 'intensity_max'. Values are strings formatted
-            as decibels (e.g. "81.833 dB"), or None if no valid values found.
+            'intensity_min', and 'intensity_max', in dB (as strings such as "81.833 dB"
+            if `as_string` is True), or None if no valid values found.
     """
     # Determine Intensity object
     if intensity_object is not None:
         intensity = intensity_object
     else:
-        if sound_object is None:
-            if audio_path is None:
-                raise ValueError("To compute intensity, provide at least one of: intensity_object, sound_object, or audio_path.")
-            sound_object = parselmouth.Sound(audio_path)
-        intensity = sound_object.to_intensity(time_step=time_step, minimum_pitch=min_pitch)
+        if sound_object is not None:
+            intensity = sound_object.to_intensity(time_step=time_step, minimum_pitch=min_pitch)
+        elif audio_path is not None:
+            intensity = _load_intensity(*_file_key(audio_path), time_step, min_pitch)
+        else:
+            raise ValueError("To compute intensity, provide at least one of: intensity_object, sound_object, or audio_path.")
+
+    values = intensity.values[0]
 
     try:
-        mean = parselmouth.praat.call(intensity, "Get mean", 0, 0, "dB")
-        stdev = parselmouth.praat.call(intensity, "Get standard deviation", 0, 0)
+        # Same split as in measure_pitch: frame statistics in one pass, extrema from Praat.
+        # Undefined (NaN) frames are skipped during the reductions rather than filtered out first
+        mean, stdev = _kernels.nan_mean_std(values)
+        if np.isnan(mean):
+            raise RuntimeError("No defined intensity frames.")
+        median = _kernels.median(values)
         minimum = parselmouth.praat.call(intensity, "Get minimum", 0, 0, "Parabolic")
         maximum = parselmouth.praat.call(intensity, "Get maximum", 0, 0, "Parabolic")
-        median = parselmouth.praat.call(intensity, "Get quantile", 0, 0, 0.5)
     except RuntimeError:
         return {
             'intensity_median': None,
@@ -377,27 +499,63 @@ def measure_intensity(audio_path=None, sound_object=None, intensity_object=None,
             'intensity_max': None
         }
 
-    return {
-        'intensity_median': f"{median:.3f} dB",
-        'intensity_mean': f"{mean:.3f} dB",
-        'intensity_std': f"{stdev:.3f} dB",
-        'intensity_min': f"{minimum:.3f} dB",
-        'intensity_max': f"{maximum:.3f} dB"
+    stats = {
+        'intensity_median': float(median),
+        'intensity_mean': float(mean),
+        'intensity_std': float(stdev),
+        'intensity_min': minimum,
+        'intensity_max': maximum
     }
 
+    return _format_measures(stats, _INTENSITY_FORMATS) if as_string else stats
+
+
+
+def _analyse_file(audio_path, min_pitch, max_pitch, time_step):
+    """
+    Return the Sound, Pitch, PointProcess and Intensity of an audio file, for one voice report.
+
+    The objects bypass the per-file caches, so that batch-processing many files releases
+    each recording as soon as its report is done.
+    """
+    sound = parselmouth.Sound(audio_path)
+    pitch = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
+    point_process = parselmouth.praat.call([sound, pitch], "To PointProcess (cc)")
+    intensity = sound.to_intensity(time_step=time_step, minimum_pitch=min_pitch)
+    return sound, pitch, point_process, intensity
+
+
+def _voice_report_from_objects(sound, pitch, point_process, intensity, as_string=True):
+    """
+    Return the `get_voice_report` dictionary for already computed Parselmouth objects.
+    """
+    return {
+        'Pitch': measure_pitch(pitch_object=pitch, as_string=as_string),
+        'Pulses': measure_pulses(point_process=point_process, as_string=as_string),
+        'Voicing': measure_voicing(point_process=point_process, pitch_object=pitch, sound_object=sound, as_string=as_string),
+        'Jitter': measure_jitter(point_process=point_process, as_string=as_string),
+        'Shimmer': measure_shimmer(point_process=point_process, sound_object=sound, as_string=as_string),
+        'Intensity': measure_intensity(intensity_object=intensity, as_string=as_string)
+    }
 
 
-def get_voice_report(audio_path, min_pitch=75, max_pitch=500, time_step=0.01):
+def get_voice_report(audio_path, min_pitch=75, max_pitch=500, time_step=0.01, as_string=True):
     """
     This function serves as a high-level aggregator that performs multiple acoustic analyses, similar to Praat's voice report. 
     It internally calls dedicated measurement functions defined in this package:
     measure_pitch, measure_pulses, measure_voicing, measure_jitter, measure_shimmer, and measure_intensity.
 
+    The Sound, Pitch, PointProcess and Intensity objects are computed once and shared by all
+    measures of the report. They are not cached between calls, so that a loop over many files
+    does not keep them in memory; use `vocalysis.VocalysisSession` to reuse them across calls.
+
     Args:
         audio_path (str): Path to an audio file (WAV or other Parselmouth-supported format).
         min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
         max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
         time_step (float, optional): Time step in seconds for intensity analysis. Defaults to 0.01.
+        as_string (bool, optional): Passed on to every measurement function. Defaults to True;
+            the default will change to False in the next minor version.
 
     Returns:
         dict: A dictionary containing acoustic measurements. Each key corresponds to a 
@@ -418,16 +576,43 @@ def get_voice_report(audio_path, min_pitch=75, max_pitch=500, time_step=0.01):
         '4.123 %'
     """
 
-    sound = parselmouth.Sound(audio_path)
-    pitch_object = sound.to_pitch(pitch_floor=min_pitch, pitch_ceiling=max_pitch)
-    point_process_object = parselmouth.praat.call([sound, pitch_object], "To PointProcess (cc)")
-    intensity = sound.to_intensity(time_step=time_step, minimum_pitch=min_pitch)
+    objects = _analyse_file(audio_path, min_pitch, max_pitch, time_step)
+    return _voice_report_from_objects(*objects, as_string=as_string)
 
-    return {
-        'Pitch': measure_pitch(pitch_object=pitch_object),
-        'Pulses': measure_pulses(point_process=point_process_object),
-        'Voicing': measure_voicing(point_process=point_process_object, pitch_object=pitch_object, sound_object=sound),
-        'Jitter': measure_jitter(point_process=point_process_object),
-        'Shimmer': measure_shimmer(point_process=point_process_object, sound_object=sound),
-        'Intensity': measure_intensity(intensity_object=intensity)
-    }
+
+def get_voice_reports(audio_paths, min_pitch=75, max_pitch=500, time_step=0.01, as_string=True, parallel=True, max_workers=None):
+    """
+    Compute `get_voice_report` for several audio files, optionally in parallel worker processes.
+
+    Praat holds the GIL while it analyses a sound, so the measures of a single report cannot
+    run concurrently in threads. Separate files are independent, however, and are distributed
+    over a process pool: each worker receives only a file path and builds the Parselmouth
+    objects for it. Starting the pool costs a few hundred milliseconds, so `parallel=False`
+    is faster for a handful of short files.
+
+    On platforms that start worker processes with "spawn" (Windows, macOS), call this function
+    from within an `if __name__ == "__main__":` block.
+
+    Args:
+        audio_paths (iterable of str): Paths to audio files (WAV or other Parselmouth-supported format).
+        min_pitch (float, optional): Minimum pitch in Hz. Defaults to 75.
+        max_pitch (float, optional): Maximum pitch in Hz. Defaults to 500.
+        time_step (float, optional): Time step in seconds for intensity analysis. Defaults to 0.01.
+        as_string (bool, optional): Passed on to `get_voice_report`. Defaults to True.
+        parallel (bool, optional): Analyse files in a process pool. Defaults to True.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        list: One `get_voice_report` dictionary per file, in the order of `audio_paths`.
+
+    Example:
+        >>> from vocalysis import get_voice_reports
+        >>> reports = get_voice_reports(["speaker1.wav", "speaker2.wav"])
+        >>> print(reports[1]["Pitch"]["mean"])
+        '142.537 Hz'
+    """
+    report = partial(get_voice_report, min_pitch=min_pitch, max_pitch=max_pitch, time_step=time_step, as_string=as_string)
+    if not parallel:
+        return [report(audio_path) for audio_path in audio_paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(report, audio_paths))